@@ -1,11 +1,25 @@
 import argparse
-import json
-from typing import TypedDict
+import asyncio
+import functools
+import hashlib
+import operator
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Annotated, Literal
+
+import orjson
+from pydantic import BaseModel, ConfigDict, Field
 
 from dotenv import load_dotenv
+from langchain_community.cache import SQLiteCache
 from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_core.globals import set_llm_cache
 from langchain_core.messages import HumanMessage
+from langgraph.cache.memory import InMemoryCache
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 from langgraph.graph import StateGraph, END
+from langgraph.types import CachePolicy
 
 
 # --- 1. Configuration ---
@@ -13,114 +27,360 @@ from langgraph.graph import StateGraph, END
 # Load API key from .env file
 load_dotenv()
 
-llm = ChatGoogleGenerativeAI(
-    model="gemini-2.5-flash",
-    temperature=0.7
-)
+# Workflow state is checkpointed here, one thread per product/audience
+# pair, so a re-run that already produced an approved copy returns it
+# without any LLM calls.
+CHECKPOINT_DB = ".langgraph.db"
+
+
+@functools.cache
+def _init_llm_cache() -> None:
+    """
+    Caches verification responses on disk, keyed by the exact prompt.
+    Re-running the workflow with the same product/audience (common while
+    developing) serves repeated Flash-Lite reviews without a network
+    call, and the cache survives across processes. Creator generations
+    are deliberately NOT cached (see get_llm). Deferred to first client
+    use so merely importing the module does not create the database
+    file.
+    """
+    set_llm_cache(SQLiteCache(database_path=".llm_cache.db"))
+
+
+@functools.cache
+def get_llm() -> ChatGoogleGenerativeAI:
+    """
+    Builds the shared LLM client on first use. Deferring construction
+    keeps import side-effect free (credential resolution no longer runs
+    for --help or tests), and caching the instance reuses one underlying
+    HTTP client and its connections across every call.
+
+    The response cache is disabled for this client on purpose: the
+    creator samples NUM_CANDIDATES drafts from the SAME prompt at
+    temperature 0.7, and an exact-prompt cache would collapse them into
+    one draft and replay identical rejections whenever consecutive
+    retry prompts are byte-identical.
+    """
+    return ChatGoogleGenerativeAI(
+        model="gemini-2.5-flash",
+        temperature=0.7,
+        cache=False
+    )
+
+
+@functools.cache
+def get_editor_llm() -> ChatGoogleGenerativeAI:
+    """
+    Verifying four rules and emitting a verdict is a far simpler task
+    than drafting, so it runs on the cheaper, faster Flash-Lite model,
+    deterministically.
+    """
+    _init_llm_cache()
+    return ChatGoogleGenerativeAI(
+        model="gemini-2.5-flash-lite",
+        temperature=0.0
+    )
+
+# Number of draft candidates generated and reviewed concurrently per
+# iteration. The first approved candidate wins, so higher values trade
+# extra LLM calls for fewer wall-clock roundtrips.
+NUM_CANDIDATES = 3
+
+# Only this many of the most recent distinct feedback items, within this
+# character budget (a rough proxy for ~500 tokens), are embedded in the
+# retry prompt. Without a cap the prompt grows with every rejection and
+# the cost per iteration climbs quadratically over a long run.
+FEEDBACK_HISTORY_LIMIT = 3
+FEEDBACK_CHAR_BUDGET = 2000
 
 
 # --- 2. Define the State ---
 
-class AgentState(TypedDict):
+# A slotted dataclass instead of a TypedDict: fields are pre-initialized
+# once, so the nodes use plain attribute access instead of repeated
+# state.get(key, default) lookups, and slots keep instances compact.
+@dataclass(slots=True)
+class AgentState:
     product_name: str
     target_audience: str
-    current_copy: str
-    editor_feedback: str
-    feedback_history: list[str]
-    decision: str  # "APPROVED" or "REJECTED"
-    retry_count: int
-    max_retries: int
+    current_copy: str = ""
+    candidate_copies: list[str] = field(default_factory=list)
+    editor_feedback: str = ""
+    # Reducer semantics: nodes return only the new feedback and LangGraph
+    # concatenates it, instead of the state copying the whole list back
+    # and forth every superstep
+    feedback_history: Annotated[list[str], operator.add] = field(
+        default_factory=list)
+    decision: str = ""  # "APPROVED" or "REJECTED"
+    retry_count: int = 0
+    max_retries: int = 5
 
 
 # --- 3. Define the Nodes (Agents) ---
 
-def creator_agent(state: AgentState):
+# Covers the common emoji blocks plus the miscellaneous symbol ranges,
+# minus the skin-tone modifiers (U+1F3FB-U+1F3FF), which are not emojis
+# on their own
+_EMOJI_BASE = '\U0001F300-\U0001F3FA\U0001F400-\U0001FAFF☀-➿'
+
+# Code points that extend an emoji rather than start a new one:
+# skin-tone modifiers and the variation selector
+_EMOJI_MODS = '\U0001F3FB-\U0001F3FF\uFE0F'
+
+# The zero-width joiner that glues multi-person sequences together
+_EMOJI_ZWJ = '\u200D'
+
+# A full emoji sequence: a base emoji, optionally extended by modifiers
+# and ZWJ-joined further emojis, counts as ONE emoji (👍🏽 and family
+# sequences used to count as 2-3 and get a valid copy locally rejected)
+_EMOJI_SEQ = (
+    f'[{_EMOJI_BASE}]'
+    f'(?:[{_EMOJI_MODS}]*{_EMOJI_ZWJ}[{_EMOJI_BASE}])*'
+    f'[{_EMOJI_MODS}]*'
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _rule_pattern(product: str) -> re.Pattern:
     """
-    The Creator generates ad copy. It checks if there is existing feedback
-    to refine the previous attempt.
+    One union pattern per product, so the local rule check tallies
+    words, emojis, hashtags and product mentions in a single scan of
+    the copy instead of four separate passes.
     """
-    product = state["product_name"]
-    audience = state["target_audience"]
-    feedback = state.get("editor_feedback", "")
-    retries = state.get("retry_count", 0)
+    return re.compile(
+        rf'(?P<prod>{re.escape(product)})'
+        rf'|(?P<emoji>{_EMOJI_SEQ})'
+        rf'|(?P<hash>#)'
+        rf'|(?P<word>[^\s#{_EMOJI_BASE}{_EMOJI_MODS}{_EMOJI_ZWJ}]+)',
+        re.IGNORECASE
+    )
 
-    # Contextual Prompting
-    if retries == 0:
-        prompt = (
-            f"Write a short, punchy social media ad caption for '{product}'. "
-            f"Target audience: {audience}. "
-            "Output ONLY the caption text."
-        )
-    else:
-        # Combine all past feedback
-        history_str = "\n".join(state.get("feedback_history", []))
-        prompt = (
-            f"Your previous draft for '{product}' was rejected.\n"
-            f"Past Feedback History:\n{history_str}\n\n"
-            f"Most Recent Feedback: {feedback}\n\n"
-            "Please write a NEW caption that fixes these issues and respects "
-            "ALL past feedback. Output ONLY the caption text."
-        )
-
-    response = llm.invoke([HumanMessage(content=prompt)])
+class DraftReview(BaseModel):
+    """A draft caption together with the model's review of it."""
+    model_config = ConfigDict(populate_by_name=True)
 
-    return {
-        "current_copy": response.content.strip(),
-        "retry_count": retries + 1
-    }
+    # "copy" stays the wire-format key via the alias; as an attribute
+    # name it would shadow BaseModel.copy and warn on every import
+    caption: str = Field(alias="copy")
+    decision: Literal["APPROVED", "REJECTED"]
+    feedback: str
 
 
-def editor_agent(state: AgentState):
-    """
-    The Editor reviews the copy against strict rules.
-    It outputs a strict format that we can parse with standard Python.
+# Constrained decoding guarantees a parseable draft/verdict triple, so a
+# malformed response can no longer masquerade as a rejection and burn a
+# whole retry iteration.
+@functools.cache
+def get_structured_creator():
+    return get_llm().with_structured_output(DraftReview)
+
+
+class EditorVerdict(BaseModel):
+    """An independent review of a single candidate copy."""
+    decision: Literal["APPROVED", "REJECTED"]
+    feedback: str
+
+
+@functools.cache
+def get_structured_editor():
+    return get_editor_llm().with_structured_output(EditorVerdict)
+
+
+# Static prefix for the verification prompt, cache-friendly like the
+# creation prompt above
+EDITOR_PROMPT_PREFIX = """
+    You review social media ad copy against these rules:
+    1. Must be under 15 words.
+    2. Must contain exactly one emoji.
+    3. Must NOT contain hashtags.
+    4. Must mention the product name explicitly.
+
+    Reject the copy if any rule is broken, with one sentence of feedback
+    explaining the reason; otherwise approve it with the feedback "Good".
     """
-    copy_to_review = state["current_copy"]
 
-    rules = """
+# All static instructions sit at the very front of the prompt and stay
+# byte-identical across calls, so Gemini's implicit prefix caching can
+# reuse them; only the product/audience/feedback vary, at the tail.
+CREATE_AND_REVIEW_PREFIX = """
+    Write a short, punchy social media ad caption, then review your own
+    caption against these rules:
     1. Must be under 15 words.
     2. Must contain exactly one emoji.
     3. Must NOT contain hashtags.
     4. Must mention the product name explicitly.
+
+    Return the caption as "copy". Set "decision" to REJECTED if any rule
+    is broken, with one sentence of "feedback" explaining the reason;
+    otherwise APPROVED with the feedback "Good".
     """
 
-    # We instruct the LLM to use a specific format for easy parsing
-    prompt = f"""
-    Review this ad copy: "{copy_to_review}"
+# Full prompt templates, assembled once at module load. Interpolating
+# only the dynamic fields keeps per-call string building minimal and,
+# more importantly, keeps the prompt bytes reproducible so the provider
+# prefix cache hits reliably.
+CREATOR_FIRST_TMPL = CREATE_AND_REVIEW_PREFIX + (
+    "Product: '{product}'. "
+    "Target audience: {audience}."
+)
 
-    Check against these rules:
-    {rules}
+CREATOR_RETRY_TMPL = CREATE_AND_REVIEW_PREFIX + (
+    "Your previous draft for '{product}' was rejected.\n"
+    "Past Feedback History:\n{history}\n\n"
+    "Most Recent Feedback: {feedback}\n\n"
+    "Please write a NEW caption that fixes these issues and respects "
+    "ALL past feedback."
+)
 
-    Respond in EXACTLY this format:
-    DECISION: [APPROVED or REJECTED]
-    FEEDBACK: [One sentence explaining the reason if rejected, or "Good" if 
-    approved]
-    """
+EDITOR_REVIEW_TMPL = EDITOR_PROMPT_PREFIX + (
+    "The product is '{product}'.\n"
+    "Review this ad copy: \"{copy}\"\n"
+)
 
-    response = llm.invoke([HumanMessage(content=prompt)])
-    content = response.content.strip()
 
-    # Parse response
-    lines = content.split('\n')
+def check_rules_locally(copy_to_review: str, product: str) -> str | None:
+    """
+    Checks the mechanical editor rules (word count, emoji count, hashtags,
+    product mention) in plain Python so an obvious rejection never costs
+    an LLM roundtrip. Returns the rejection reason, or None if all local
+    rules pass.
+    """
+    word_count = 0
+    emoji_count = 0
+    hashtag_count = 0
+    product_mentions = 0
+
+    for match in _rule_pattern(product).finditer(copy_to_review):
+        group = match.lastgroup
+        if group == "word":
+            word_count += 1
+        elif group == "emoji":
+            emoji_count += 1
+        elif group == "hash":
+            hashtag_count += 1
+        else:  # a product mention also counts towards the word total
+            product_mentions += 1
+            word_count += len(match.group().split())
+
+    if word_count >= 15:
+        return "The copy is 15 words or longer"
+
+    if emoji_count == 0:
+        return "The copy does not contain an emoji"
+    if emoji_count > 1:
+        return "The copy contains more than one emoji"
+
+    if hashtag_count > 0:
+        return "The copy contains a hashtag"
+
+    if product_mentions == 0:
+        return "The copy does not mention the product name"
+
+    return None
+
+async def draft_and_self_review(prompt: str, product: str):
+    """
+    Generates one draft with its self-review and returns
+    (copy, decision, feedback). The mechanical rules are re-checked
+    locally so an over-optimistic self-approval cannot slip through.
+    """
+    # Stream the response and cut the generation short on approval: the
+    # schema emits the copy first, then the decision, and approved
+    # drafts never use their feedback sentence.
+    copy_text = ""
     decision = "REJECTED"  # Default safe state
-    feedback = "Error parsing feedback"
+    feedback = "Error parsing response"
+    async for partial in get_structured_creator().astream(
+            [HumanMessage(content=prompt)]):
+        if isinstance(partial, DraftReview):
+            copy_text = partial.caption
+            decision, feedback = partial.decision, partial.feedback
+        elif isinstance(partial, dict):
+            copy_text = partial.get("copy", copy_text)
+            decision = partial.get("decision", decision)
+            feedback = partial.get("feedback", feedback)
+        if decision == "APPROVED":
+            feedback = "Good"
+            break
+
+    copy_text = copy_text.strip()
+
+    # The self-review is not trusted on the mechanical rules
+    rejection = check_rules_locally(copy_text, product)
+    if rejection is not None:
+        return copy_text, "REJECTED", rejection
+
+    # Self-approvals get one independent double-check on the cheap
+    # model, restoring the old Editor's impartiality at a fraction of
+    # its cost; self-rejections are taken at their word.
+    if decision == "APPROVED":
+        prompt = EDITOR_REVIEW_TMPL.format(product=product, copy=copy_text)
+        verdict = await get_structured_editor().ainvoke(
+            [HumanMessage(content=prompt)])
+        decision, feedback = verdict.decision, verdict.feedback
+
+    return copy_text, decision, feedback
+
+
+async def create_and_review(state: AgentState):
+    """
+    Generates NUM_CANDIDATES drafts concurrently, each reviewed against
+    the rules in the same LLM call that wrote it, and keeps the first
+    approved one. Fusing creation and review into one prompt halves the
+    roundtrips of the old separate Creator/Editor pair.
+    """
+    product = state.product_name
+    audience = state.target_audience
+    feedback = state.editor_feedback
+    retries = state.retry_count
 
-    for line in lines:
-        if line.startswith("DECISION:"):
-            decision = line.replace("DECISION:", "").strip().upper()
-        if line.startswith("FEEDBACK:"):
-            feedback = line.replace("FEEDBACK:", "").strip()
+    # Contextual Prompting
+    if retries == 0:
+        prompt = CREATOR_FIRST_TMPL.format(product=product,
+                                           audience=audience)
+    else:
+        # Combine recent feedback, deduplicated (the model repeating a
+        # mistake repeats the feedback) and capped so the prompt stays
+        # bounded no matter how many retries it took to get here
+        recent = list(dict.fromkeys(state.feedback_history))
+        recent = recent[-FEEDBACK_HISTORY_LIMIT:]
+        history_str = "\n".join(recent)[:FEEDBACK_CHAR_BUDGET]
+        prompt = CREATOR_RETRY_TMPL.format(product=product,
+                                           history=history_str,
+                                           feedback=feedback)
+
+    # Speculatively generate several drafts in parallel; temperature
+    # gives each call a different candidate.
+    results = await asyncio.gather(*[
+        draft_and_self_review(prompt, product)
+        for _ in range(NUM_CANDIDATES)
+    ])
+    candidates = [copy for copy, _, _ in results]
+
+    # Keep the first approved candidate, if any
+    for copy, decision, verdict_feedback in results:
+        if decision == "APPROVED":
+            return {
+                "current_copy": copy,
+                "candidate_copies": candidates,
+                "decision": "APPROVED",
+                "editor_feedback": verdict_feedback,
+                "retry_count": retries + 1
+            }
 
-    # Append new feedback to history
-    current_history = state.get("feedback_history", [])
-    if feedback and feedback != "Good":
-        current_history.append(feedback)
+    # All rejected: refine from the first candidate and its feedback.
+    # Only the delta is returned; the reducer appends it to the history.
+    _, _, verdict_feedback = results[0]
+    new_feedback = []
+    if verdict_feedback and verdict_feedback != "Good":
+        new_feedback = [verdict_feedback]
 
     return {
-        "decision": decision,
-        "editor_feedback": feedback,
-        "feedback_history": current_history,
-        "current_copy": copy_to_review 
+        "current_copy": candidates[0],
+        "candidate_copies": candidates,
+        "decision": "REJECTED",
+        "editor_feedback": verdict_feedback,
+        "feedback_history": new_feedback,
+        "retry_count": retries + 1
     }
 
 
@@ -130,15 +390,11 @@ def should_continue(state: AgentState):
     """
     Decides if the loop should continue, stop, or force quit.
     """
-    decision = state["decision"]
-    retries = state["retry_count"]
-
-    if decision == "APPROVED":
+    if state.decision == "APPROVED":
         return "approved"
 
     # Guardrail: Prevent infinite loops
-    max_retries = state.get("max_retries", 5)
-    if retries >= max_retries:
+    if state.retry_count >= state.max_retries:
         return "max_retries"
 
     return "rejected"
@@ -146,94 +402,184 @@ def should_continue(state: AgentState):
 
 # --- 5. Build the Graph ---
 
+def _node_cache_key(state: AgentState) -> str:
+    """
+    The node's output depends only on its prompt inputs, so cache on a
+    digest of the product, audience and accumulated feedback. The retry
+    count is part of the key because the node both branches on it and
+    writes it back: without it, a rejection that adds no new feedback
+    would reproduce the same key next superstep and replay the cached
+    update with a frozen retry_count, looping past the max_retries
+    guardrail forever.
+    """
+    key = "\n".join([
+        state.product_name,
+        state.target_audience,
+        str(state.retry_count),
+        state.editor_feedback,
+        *state.feedback_history
+    ])
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
 workflow = StateGraph(AgentState)
 
-# Add Nodes
-workflow.add_node("creator", creator_agent)
-workflow.add_node("editor", editor_agent)
+# Add Nodes: skip the whole superstep when the same prompt inputs come
+# around again (e.g. an identical re-run)
+workflow.add_node("create_and_review", create_and_review,
+                  cache_policy=CachePolicy(key_func=_node_cache_key,
+                                           ttl=3600))
 
 # Add Edges
-workflow.set_entry_point("creator")
-workflow.add_edge("creator", "editor")
+workflow.set_entry_point("create_and_review")
 
 # Conditional Edge
 workflow.add_conditional_edges(
-    "editor",
+    "create_and_review",
     should_continue,
     {
         "approved": END,
-        "rejected": "creator",
+        "rejected": "create_and_review",
         "max_retries": END
     }
 )
 
-# Compile
-app = workflow.compile()
+# --- 6. Execution Helper ---
+
+# Concurrent workflows allowed in batch mode before the provider's rate
+# limits start pushing back
+MAX_CONCURRENT_WORKFLOWS = 16
 
 
-# --- 6. Execution Helper ---
+def _print_record(record: dict) -> None:
+    # orjson serializes straight to bytes, so write to the raw buffer
+    sys.stdout.buffer.write(orjson.dumps(record, option=orjson.OPT_INDENT_2))
+    sys.stdout.buffer.write(b"\n")
+
+
+def _approved_record(product: str, audience: str, copy: str) -> dict:
+    return {
+        "adcp_version": "1.0",
+        "task": "creative_generation",
+        "payload": {
+            "product_name": product,
+            "target_audience": audience,
+            "creative_assets": [
+                {
+                    "type": "text_ad",
+                    "content": copy,
+                    "metadata": {
+                        "length": len(copy),
+                        "sentiment": "energetic"
+                    }
+                }
+            ],
+            "brand_safety_check": "passed"
+        }
+    }
+
+
+async def arun_workflow(app, product: str, audience: str,
+                        verbose: bool = False, max_retries: int = 5) -> dict:
+    """
+    Runs one workflow to completion and returns the result record
+    (success or failure) instead of printing it, so many workflows can
+    be driven concurrently.
+    """
+    # One checkpoint thread per product/audience pair
+    config = {"configurable": {"thread_id": f"{product}|{audience}"}}
+
+    # Short-circuit: a previous run already approved a copy for this
+    # product/audience, so there is nothing left to generate
+    checkpoint = await app.aget_state(config)
+    if checkpoint and checkpoint.values.get("decision") == "APPROVED":
+        if verbose:
+            print("--- Reusing checkpointed result ---")
+        return _approved_record(product, audience,
+                                checkpoint.values["current_copy"])
 
-def run_workflow(product: str, audience: str, verbose: bool = False,
-                 max_retries: int = 5):
     if verbose:
         print("--- Starting Workflow ---")
 
+    # All remaining fields take their dataclass defaults
     inputs = {
         "product_name": product,
         "target_audience": audience,
-        "retry_count": 0,
-        "current_copy": "",
-        "editor_feedback": "",
-        "feedback_history": [],
-        "decision": "",
         "max_retries": max_retries
     }
 
-    # stream() yields events as the graph processes them
+    # astream() yields events as the graph processes them
     final_state = None
-    for output in app.stream(inputs):
+    async for output in app.astream(inputs, config):
         for key, value in output.items():
             final_state = value
-            if verbose:
-                if key == "creator":
-                    print(f"\nCREATOR generated draft #{value['retry_count']}:")
-                    print(f"   \"{value['current_copy']}\"")
-                elif key == "editor":
-                    print("\nEDITOR review:")
-                    print(f"   Decision: {value['decision']}")
-                    print(f"   Feedback: {value['editor_feedback']}")
+            if verbose and key == "create_and_review":
+                print(f"\nAttempt #{value['retry_count']} drafts:")
+                for candidate in value['candidate_copies']:
+                    print(f"   \"{candidate}\"")
+                print(f"   Decision: {value['decision']}")
+                print(f"   Feedback: {value['editor_feedback']}")
 
     if final_state and final_state.get("decision") == "APPROVED":
-        output_json = {
-            "adcp_version": "1.0",
-            "task": "creative_generation",
-            "payload": {
-                "product_name": product,
-                "target_audience": audience,
-                "creative_assets": [
-                    {
-                        "type": "text_ad",
-                        "content": final_state["current_copy"],
-                        "metadata": {
-                            "length": len(final_state["current_copy"]),
-                            "sentiment": "energetic"
+        return _approved_record(product, audience,
+                                final_state["current_copy"])
+
+    # Handle failure case
+    return {
+        "adcp_version": "1.0",
+        "task": "creative_generation",
+        "error": "Max retries reached or workflow failed",
+        "payload": {
+            "brand_safety_check": "failed"
+        }
+    }
+
+
+async def run_workflow(product: str, audience: str, verbose: bool = False,
+                       max_retries: int = 5):
+    async with AsyncSqliteSaver.from_conn_string(CHECKPOINT_DB) as saver:
+        app = workflow.compile(cache=InMemoryCache(), checkpointer=saver)
+        result = await arun_workflow(app, product, audience, verbose=verbose,
+                                     max_retries=max_retries)
+    _print_record(result)
+
+
+async def run_batch(batch_file: str, max_retries: int = 5):
+    """
+    Runs one workflow per JSONL record of {"product", "audience"},
+    driving up to MAX_CONCURRENT_WORKFLOWS of them at a time.
+    """
+    with open(batch_file, "rb") as f:
+        records = [orjson.loads(line) for line in f if line.strip()]
+
+    # Guard against hammering the provider's rate limits
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_WORKFLOWS)
+
+    async with AsyncSqliteSaver.from_conn_string(CHECKPOINT_DB) as saver:
+        app = workflow.compile(cache=InMemoryCache(), checkpointer=saver)
+
+        async def bounded_run(record: dict) -> dict:
+            async with semaphore:
+                # One malformed record or provider error (e.g. a 429
+                # under full concurrency) must not sink the whole batch
+                try:
+                    return await arun_workflow(app, record["product"],
+                                               record["audience"],
+                                               max_retries=max_retries)
+                except Exception as exc:
+                    return {
+                        "adcp_version": "1.0",
+                        "task": "creative_generation",
+                        "error": f"Workflow failed: {exc}",
+                        "payload": {
+                            "brand_safety_check": "failed"
                         }
                     }
-                ],
-                "brand_safety_check": "passed"
-            }
-        }
-        print(json.dumps(output_json, indent=2))
-    else:
-        # Handle failure case
-        print(json.dumps({
-            "adcp_version": "1.0",
-            "task": "creative_generation",
-            "error": "Max retries reached or workflow failed",
-             "payload": {
-                "brand_safety_check": "failed"
-            }
-        }, indent=2))
+
+        results = await asyncio.gather(*[bounded_run(r) for r in records])
+
+    for result in results:
+        _print_record(result)
 
 
 # --- 7. Run Script ---
@@ -248,13 +594,22 @@ if __name__ == "__main__":
                         help="Target audience")
     parser.add_argument("-v", "--verbose", action="store_true", 
                         help="Enable verbose logging")
-    parser.add_argument("--max-retries", type=int, default=5, 
+    parser.add_argument("--max-retries", type=int, default=5,
                         help="Maximum number of retries")
+    parser.add_argument("--batch-file", type=str, default=None,
+                        help="JSONL file of {product, audience} records to "
+                             "run concurrently instead of a single workflow")
     args = parser.parse_args()
 
-    run_workflow(
-        product=args.product,
-        audience=args.audience,
-        verbose=args.verbose,
-        max_retries=args.max_retries
-    )
+    if args.batch_file:
+        asyncio.run(run_batch(
+            batch_file=args.batch_file,
+            max_retries=args.max_retries
+        ))
+    else:
+        asyncio.run(run_workflow(
+            product=args.product,
+            audience=args.audience,
+            verbose=args.verbose,
+            max_retries=args.max_retries
+        ))